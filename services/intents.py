@@ -1,16 +1,130 @@
-import json
 import logging
-import os
+import re
+from functools import lru_cache
 from typing import Dict, Any, Tuple, Optional
 
+import numpy as np
 import spacy
 
+from utils import helpers
+
 # set up logging
 logger = logging.getLogger(__name__)
 
-# location config constants
-DEFAULT_LOCATION = "Santa Cruz"
-LOCATION_CONFIG_FILE = "location_config.json"
+# only ner and the word vectors are used, skip the rest of the pipeline
+UNUSED_PIPES = ["tagger", "parser", "attribute_ruler", "lemmatizer"]
+
+# intents whose handling needs ner entities (location)
+ENTITY_INTENTS = {"WEATHER", "LOCATION_SETTING"}
+
+# fallback phrases that precede a location, matched in one pass
+LOCATION_PHRASES = [
+    "set my location to ",
+    "change my location to ",
+    "update my location to ",
+    "my location is ",
+    "i'm in ",
+    "i am in ",
+    "save my location as "
+]
+_LOCATION_PHRASE_RE = re.compile(
+    "(?:" + "|".join(re.escape(phrase) for phrase in LOCATION_PHRASES) + ")([^.?!]*)"
+)
+
+# intent categories with examples
+INTENT_EXAMPLES = {
+    "WEATHER": [
+        "what's the weather like",
+        "how's the weather today",
+        "is it going to rain",
+        "what's the temperature outside",
+        "will it be sunny tomorrow",
+        "what's the forecast",
+        "how hot is it today",
+        "is it cold outside",
+        "what's the weather in"
+    ],
+    "TIME": [
+        "what time is it",
+        "what's the current time",
+        "tell me the time",
+        "what's today's date",
+        "what day is it",
+        "what month is it",
+        "what's the date today",
+        "tell me today's date",
+        "what year is it"
+    ],
+    "LOCATION_SETTING": [
+        "set my location to",
+        "change my location to",
+        "update my location to",
+        "my location is",
+        "i'm in",
+        "set my location",
+        "remember my location",
+        "save my location as"
+    ]
+}
+
+
+@lru_cache(maxsize=None)
+def _get_nlp(model: str):
+    """load a spacy model once per process.
+
+    args:
+        model: spacy model name
+
+    returns:
+        loaded spacy pipeline
+    """
+    return spacy.load(model, disable=UNUSED_PIPES)
+
+
+def _unit_vector(vector: np.ndarray) -> np.ndarray:
+    """scale vector to unit length (zero vectors stay zero).
+
+    args:
+        vector: vector to normalize
+
+    returns:
+        float32 unit vector
+    """
+    vector = np.asarray(vector, dtype=np.float32)
+    return vector / (np.linalg.norm(vector) + 1e-9)
+
+
+@lru_cache(maxsize=None)
+def _get_example_index(model: str) -> Tuple[list, list, list, np.ndarray, np.ndarray]:
+    """build the flat inner-product index over intent examples once per model.
+
+    the lru_cache shares one index between all detectors; arrays are
+    made read-only so no detector can modify the shared copy.
+
+    args:
+        model: spacy model name
+
+    returns:
+        tuple of (row intents, row examples, intent names, intent start rows, example matrix)
+    """
+    nlp = _get_nlp(model)
+
+    # examples only need word vectors, so tokenizing is enough
+    pairs = [(intent, ex) for intent, examples in INTENT_EXAMPLES.items() for ex in examples]
+    example_docs = nlp.tokenizer.pipe([ex for _, ex in pairs], batch_size=32)
+
+    # one normalized row per example
+    row_intents = [intent for intent, _ in pairs]
+    row_examples = [ex for _, ex in pairs]
+    intent_names = list(INTENT_EXAMPLES)
+    counts = [len(INTENT_EXAMPLES[intent]) for intent in intent_names]
+    intent_starts = np.cumsum([0] + counts[:-1])
+    ex_matrix = np.vstack([_unit_vector(doc.vector) for doc in example_docs])
+
+    intent_starts.setflags(write=False)
+    ex_matrix.setflags(write=False)
+
+    return row_intents, row_examples, intent_names, intent_starts, ex_matrix
 
 
 class SimilarityIntentDetector:
@@ -23,55 +137,47 @@ class SimilarityIntentDetector:
             model: spacy model to use (needs word vectors)
         """
         try:
-            self.brain = spacy.load(model)
+            self.brain = _get_nlp(model)
             logger.info(f"loaded spacy model: {model}")
         except Exception as e:
             logger.error(f"error loading spacy model: {e}")
             raise ValueError(f"failed to load spacy model '{model}': {e}")
 
         # intent categories with examples
-        self.intent_examples = {
-            "WEATHER": [
-                "what's the weather like",
-                "how's the weather today",
-                "is it going to rain",
-                "what's the temperature outside",
-                "will it be sunny tomorrow",
-                "what's the forecast",
-                "how hot is it today",
-                "is it cold outside",
-                "what's the weather in"
-            ],
-            "TIME": [
-                "what time is it",
-                "what's the current time",
-                "tell me the time",
-                "what's today's date",
-                "what day is it",
-                "what month is it",
-                "what's the date today",
-                "tell me today's date",
-                "what year is it"
-            ],
-            "LOCATION_SETTING": [
-                "set my location to",
-                "change my location to",
-                "update my location to",
-                "my location is",
-                "i'm in",
-                "set my location",
-                "remember my location",
-                "save my location as"
-            ]
-        }
+        self.intent_examples = INTENT_EXAMPLES
+
+        # example index is built once per model and shared between detectors
+        (self._row_intents, self._row_examples, self._intent_names,
+         self._intent_starts, self._ex_matrix) = _get_example_index(model)
 
-        # process examples
-        self.processed_examples = {}
-        for intent, examples in self.intent_examples.items():
-            self.processed_examples[intent] = [self.brain(ex) for ex in examples]
+        # scratch buffers reused by every query instead of reallocating
+        self._query = np.empty(self._ex_matrix.shape[1], dtype=np.float32)
+        self._scores = np.empty(self._ex_matrix.shape[0], dtype=np.float32)
+
+        # last classify result, reused by the is_* helpers
+        self._last_text = None
+        self._last_result = None
 
         logger.info("initialized intent examples")
 
+    def classify(self, text: str) -> Dict[str, Any]:
+        """detect intent once per utterance.
+
+        repeat calls with the same text reuse the last result, so the
+        is_* helpers and location handling share one pipeline run.
+
+        args:
+            text: user input text
+
+        returns:
+            dict from detect_intent
+        """
+        if text != self._last_text:
+            self._last_result = self.detect_intent(text)
+            self._last_text = text
+
+        return self._last_result
+
     def detect_intent(self, text: str) -> Dict[str, Any]:
         """detect user intent using semantic similarity.
 
@@ -81,41 +187,52 @@ class SimilarityIntentDetector:
         returns:
             dict with detected intent and confidence
         """
-        # process input
-        doc = self.brain(text.lower())
+        text_lower = text.lower()
+
+        # tokenize only; word vectors come straight from the vocab
+        doc = self.brain.make_doc(text_lower)
 
         # find best match
         best_intent = None
         best_score = 0.0
         best_example = None
-        all_scores = {}
 
-        # compare with each category
-        for intent, examples in self.processed_examples.items():
-            # find best score for this intent
-            intent_scores = [doc.similarity(ex) for ex in examples]
-            best_intent_score = max(intent_scores)
-            best_example_idx = intent_scores.index(best_intent_score)
+        if not doc.vector_norm:
+            # empty or out-of-vocabulary text can't match any example
+            all_scores = dict.fromkeys(self._intent_names, 0.0)
+        else:
+            # cosine similarity against every example at once
+            np.multiply(doc.vector, 1.0 / doc.vector_norm, out=self._query)
+            scores = np.dot(self._ex_matrix, self._query, out=self._scores)
 
-            all_scores[intent] = best_intent_score
+            # best score per intent, reduced over each intent's rows
+            intent_scores = np.maximum.reduceat(scores, self._intent_starts)
+            all_scores = dict(zip(self._intent_names, intent_scores.tolist()))
 
-            # track overall best
-            if best_intent_score > best_score:
-                best_score = best_intent_score
-                best_intent = intent
-                best_example = self.intent_examples[intent][best_example_idx]
+            best_row = int(np.argmax(scores))
+            if scores[best_row] > best_score:
+                best_score = float(scores[best_row])
+                best_intent = self._row_intents[best_row]
+                best_example = self._row_examples[best_row]
 
         # require good enough match
         threshold = 0.70  # adjustable
         detected_intent = best_intent if best_score >= threshold else None
 
+        # run ner only when the intent actually uses entities
+        entities = {}
+        if detected_intent in ENTITY_INTENTS:
+            doc = self.brain(doc)
+            entities = self.extract_entities(doc)
+
         result = {
             "original_text": text,
+            "normalized_text": text_lower,
             "intent": detected_intent,
             "confidence": best_score,
             "all_scores": all_scores,
             "best_matching_example": best_example,
-            "entities": self.extract_entities(doc)
+            "entities": entities
         }
 
         return result
@@ -131,18 +248,13 @@ class SimilarityIntentDetector:
         """
         found_things = {}
 
-        # extract locations
-        places = []
+        # one pass: first location wins, last date/time wins
         for ent in doc.ents:
-            if ent.label_ in ["GPE", "LOC"]:
-                places.append(ent.text)
-
-        if places:
-            found_things["location"] = places[0]
-
-        # extract date/time
-        for ent in doc.ents:
-            if ent.label_ == "DATE" or ent.label_ == "TIME":
+            label = ent.label_
+            if label in ("GPE", "LOC"):
+                if "location" not in found_things:
+                    found_things["location"] = ent.text
+            elif label in ("DATE", "TIME"):
                 found_things["datetime"] = ent.text
 
         return found_things
@@ -156,7 +268,7 @@ class SimilarityIntentDetector:
         returns:
             tuple of (is_weather_query, location)
         """
-        result = self.detect_intent(text)
+        result = self.classify(text)
 
         is_weather = result["intent"] == "WEATHER"
         location = result["entities"].get("location")
@@ -172,7 +284,7 @@ class SimilarityIntentDetector:
         returns:
             true if time query, false otherwise
         """
-        result = self.detect_intent(text)
+        result = self.classify(text)
         return result["intent"] == "TIME"
 
     def is_location_setting(self, text: str) -> Tuple[bool, Optional[str]]:
@@ -184,18 +296,19 @@ class SimilarityIntentDetector:
         returns:
             tuple of (is_location_setting, location)
         """
-        result = self.detect_intent(text)
+        result = self.classify(text)
 
         is_setting_location = result["intent"] == "LOCATION_SETTING"
         location = result["entities"].get("location")
 
         return is_setting_location, location
 
-    def extract_location_from_text(self, text: str) -> Optional[str]:
+    def extract_location_from_text(self, text: str, text_lower: Optional[str] = None) -> Optional[str]:
         """extract location from raw text.
 
         args:
             text: text to extract from
+            text_lower: already lowercased text, if the caller has it
 
         returns:
             location or none if not found
@@ -207,26 +320,13 @@ class SimilarityIntentDetector:
             return places[0]
 
         # fallback to pattern matching if no entities found
-        text_lower = text.lower()
-        location_phrases = [
-            "set my location to ",
-            "change my location to ",
-            "update my location to ",
-            "my location is ",
-            "i'm in ",
-            "i am in ",
-            "save my location as "
-        ]
-
-        for phrase in location_phrases:
-            if phrase in text_lower:
-                # get location after phrase
-                place = text_lower.split(phrase, 1)[1].strip()
-                # remove sentence endings
-                for ending in ['.', '?', '!']:
-                    if ending in place:
-                        place = place.split(ending, 1)[0].strip()
-                return place if place else None
+        # location is whatever follows the phrase, up to a sentence ending
+        if text_lower is None:
+            text_lower = text.lower()
+        match = _LOCATION_PHRASE_RE.search(text_lower)
+        if match:
+            place = match.group(1).strip()
+            return place if place else None
 
         return None
 
@@ -239,15 +339,12 @@ class SimilarityIntentDetector:
         returns:
             true if successful, false otherwise
         """
-        try:
-            config = {'location': location}
-            with open(LOCATION_CONFIG_FILE, 'w') as f:
-                json.dump(config, f)
+        # helpers already logs the failure
+        if helpers.save_location(location):
             logger.info(f"saved location: {location}")
             return True
-        except Exception as e:
-            logger.error(f"error saving location: {e}")
-            return False
+
+        return False
 
     def get_saved_location(self) -> str:
         """get user's saved location.
@@ -255,15 +352,7 @@ class SimilarityIntentDetector:
         returns:
             saved location or default
         """
-        try:
-            if os.path.exists(LOCATION_CONFIG_FILE):
-                with open(LOCATION_CONFIG_FILE, 'r') as f:
-                    config = json.load(f)
-                    return config.get('location', DEFAULT_LOCATION)
-        except Exception as e:
-            logger.error(f"error reading location config: {e}")
-
-        return DEFAULT_LOCATION
+        return helpers.get_saved_location()
 
     def handle_location_setting(self, text: str) -> Tuple[bool, str]:
         """handle location setting intent.
@@ -275,14 +364,15 @@ class SimilarityIntentDetector:
             tuple of (success, response_message)
         """
         # check if it's a location setting query
-        is_setting, location = self.is_location_setting(text)
+        result = self.classify(text)
 
-        if not is_setting:
+        if result["intent"] != "LOCATION_SETTING":
             return False, ""
 
         # if no location detected by entity recognition, try pattern matching
+        location = result["entities"].get("location")
         if not location:
-            location = self.extract_location_from_text(text)
+            location = self.extract_location_from_text(text, result["normalized_text"])
 
         if location:
             success = self.save_location(location)
@@ -312,7 +402,7 @@ def example_usage():
     ]
 
     for question in test_questions:
-        result = mind_reader.detect_intent(question)
+        result = mind_reader.classify(question)
         print(f"Query: {question}")
         print(f"Detected intent: {result['intent']} (confidence: {result['confidence']:.2f})")
         print(f"Best matching example: '{result['best_matching_example']}'")
@@ -1,13 +1,18 @@
-import json
 import logging
 from typing import Iterator, Optional
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException, Timeout, ConnectionError
 
 # set up logging
 logger = logging.getLogger(__name__)
 
+# keep-alive session so every prompt reuses the same connection to ollama
+_session = requests.Session()
+_session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+
 
 class OllamaAPIError(Exception):
     """exception raised for ollama api errors."""
@@ -45,23 +50,42 @@ def get_ollama_response(
         brain_food["system"] = system_prompt
 
     try:
-        response = requests.post(url, json=brain_food, stream=True, timeout=30)
+        response = _session.post(url, json=brain_food, stream=True, timeout=30)
         response.raise_for_status()
 
+        def read_chunk(line: bytes) -> Optional[str]:
+            try:
+                chunk_data = orjson.loads(line)
+            except orjson.JSONDecodeError as e:
+                logger.warning(f"error parsing json response: {e}")
+                return None
+            if 'response' in chunk_data:
+                return chunk_data['response']
+            if 'error' in chunk_data:
+                logger.error(f"ollama api error: {chunk_data['error']}")
+                raise OllamaAPIError(f"ollama api error: {chunk_data['error']}")
+            return None
+
         def brain_stream() -> Iterator[str]:
-            for thought in response.iter_lines():
-                if thought:
-                    chunk = thought.decode('utf-8')
-                    try:
-                        chunk_data = json.loads(chunk)
-                        if 'response' in chunk_data:
-                            yield chunk_data['response']
-                        elif 'error' in chunk_data:
-                            logger.error(f"ollama api error: {chunk_data['error']}")
-                            raise OllamaAPIError(f"ollama api error: {chunk_data['error']}")
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"error parsing json response: {e}")
-                        continue
+            # ndjson: split raw bytes on newlines as soon as they arrive
+            pending = b""
+            try:
+                for data in response.iter_content(chunk_size=None):
+                    pending += data
+                    while (end := pending.find(b"\n")) != -1:
+                        line, pending = pending[:end], pending[end + 1:]
+                        if line:
+                            thought = read_chunk(line)
+                            if thought is not None:
+                                yield thought
+
+                if pending.strip():
+                    thought = read_chunk(pending)
+                    if thought is not None:
+                        yield thought
+            finally:
+                # release the connection even if we stop reading early
+                response.close()
 
         return brain_stream()
     except Timeout:
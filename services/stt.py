@@ -1,18 +1,97 @@
 import logging
-from typing import Callable, Any
-from threading import Event
+import time
+from typing import Callable, Any, Optional
+from threading import Event, Lock
 
+import numpy as np
 import speech_recognition as sr
 
 # set up logging
 logger = logging.getLogger(__name__)
 
+# local whisper model, int8 keeps it fast on cpu
+WHISPER_MODEL = "base.en"
+_whisper_model = None
+_whisper_failed = False
+_whisper_lock = Lock()
+
+# ambient noise calibration, reused between listens
+NOISE_RECALIBRATE_SECONDS = 60
+_noise_state = {"threshold": None, "ts": 0.0}
+
 
 class SpeechRecognitionError(Exception):
     """exception for speech recognition errors."""
     pass
 
 
+def load_whisper_model() -> Optional[Any]:
+    """load local whisper model once.
+
+    returns:
+        whisper model or none if unavailable
+    """
+    global _whisper_model, _whisper_failed
+
+    with _whisper_lock:
+        if _whisper_model is None and not _whisper_failed:
+            try:
+                from faster_whisper import WhisperModel
+                _whisper_model = WhisperModel(WHISPER_MODEL, device="cpu", compute_type="int8")
+                logger.info(f"loaded whisper model: {WHISPER_MODEL}")
+            except Exception as e:
+                logger.warning(f"local whisper unavailable, using google speech: {e}")
+                _whisper_failed = True
+
+    return _whisper_model
+
+
+def calibrate_noise(recognizer: sr.Recognizer, ear: sr.Microphone) -> None:
+    """set energy threshold, only sampling background noise once a minute.
+
+    args:
+        recognizer: speech recognizer instance
+        ear: open microphone source
+    """
+    now = time.monotonic()
+    if _noise_state["threshold"] is None or now - _noise_state["ts"] > NOISE_RECALIBRATE_SECONDS:
+        recognizer.adjust_for_ambient_noise(ear, duration=0.20)
+        _noise_state.update(threshold=recognizer.energy_threshold, ts=now)
+        logger.debug("adjusted for background noise")
+    else:
+        recognizer.energy_threshold = _noise_state["threshold"]
+
+
+def transcribe(recognizer: sr.Recognizer, voice_sample: sr.AudioData) -> str:
+    """turn captured audio into text.
+
+    args:
+        recognizer: speech recognizer instance
+        voice_sample: captured audio
+
+    returns:
+        recognized text
+
+    raises:
+        unknown_value_error: if no speech was recognized
+        request_error: if the google fallback fails
+    """
+    whisper = load_whisper_model()
+    if whisper is None:
+        return recognizer.recognize_google(voice_sample)
+
+    # whisper wants 16khz mono float32 in [-1, 1]
+    sound_bytes = voice_sample.get_raw_data(convert_rate=16000, convert_width=2)
+    sound = np.frombuffer(sound_bytes, dtype=np.int16).astype(np.float32) / 32768.0
+
+    segments, _ = whisper.transcribe(sound, beam_size=1, vad_filter=True, language="en")
+    words = " ".join(segment.text.strip() for segment in segments).strip()
+    if not words:
+        raise sr.UnknownValueError()
+
+    return words
+
+
 def listen_to_microphone(
         recognizer: sr.Recognizer,
         should_listen: bool,
@@ -36,8 +115,7 @@ def listen_to_microphone(
     try:
         with sr.Microphone() as ear:
             try:
-                recognizer.adjust_for_ambient_noise(ear, duration=0.20)
-                logger.debug("adjusted for background noise")
+                calibrate_noise(recognizer, ear)
             except Exception as e:
                 logger.error(f"error adjusting for noise: {e}")
                 call_from_thread(update_status, f"error adjusting for noise: {str(e)}", "error")
@@ -66,7 +144,7 @@ def listen_to_microphone(
                     if voice_sample:
                         call_from_thread(update_status, "processing speech...", "processing")
                         try:
-                            words = recognizer.recognize_google(voice_sample)
+                            words = transcribe(recognizer, voice_sample)
                             logger.info(f"recognized: {words}")
 
                             if stop_event.is_set():
@@ -1,6 +1,16 @@
+import re
 from datetime import datetime
 from typing import Dict
 
+# time/date words, matched as whole words in one pass
+_TIME_WORDS_RE = re.compile(r"\b(?:time|clock|date|day|today|month|year)s?\b")
+
+# get_time_data fields, in the same order as TIME_DATA_FORMAT
+TIME_DATA_KEYS = (
+    "current_time", "current_date", "day_of_week", "month", "day", "year", "timestamp"
+)
+TIME_DATA_FORMAT = "%I:%M %p|%A, %B %d, %Y|%A|%B|%d|%Y|%Y-%m-%d %H:%M:%S"
+
 
 def is_time_query(text: str) -> bool:
     """check if query is about time or date.
@@ -11,12 +21,7 @@ def is_time_query(text: str) -> bool:
     returns:
         true if time-related, false otherwise
     """
-    time_words = [
-        'time', 'what time', 'current time', 'clock',
-        'date', 'day', 'today', 'month', 'year', 'what day'
-    ]
-    text_lower = text.lower()
-    return any(word in text_lower for word in time_words)
+    return bool(_TIME_WORDS_RE.search(text.lower()))
 
 
 def get_time_data() -> Dict[str, str]:
@@ -27,15 +32,10 @@ def get_time_data() -> Dict[str, str]:
     """
     now = datetime.now()
 
-    return {
-        "current_time": now.strftime("%I:%M %p"),
-        "current_date": now.strftime("%A, %B %d, %Y"),
-        "day_of_week": now.strftime("%A"),
-        "month": now.strftime("%B"),
-        "day": now.strftime("%d"),
-        "year": now.strftime("%Y"),
-        "timestamp": now.strftime("%Y-%m-%d %H:%M:%S"),
-    }
+    # format everything in one strftime pass
+    fields = now.strftime(TIME_DATA_FORMAT).split("|")
+
+    return dict(zip(TIME_DATA_KEYS, fields))
 
 
 def format_time_data_for_prompt(time_data: Dict[str, str]) -> str:
@@ -1,23 +1,133 @@
 import logging
+from collections import deque
 from threading import Event
-from typing import Callable
+from typing import Any, Callable
 
-import speech_recognition as sr
+import pyaudio
 
 # set up logging
 logger = logging.getLogger(__name__)
 
+# pocketsphinx expects 16khz mono, fed in small frames
+SAMPLE_RATE = 16000
+FRAME_SIZE = 512
+# frames buffered between the audio callback and the decoder (~2s)
+RING_FRAMES = 64
+
 
 class WakeWordError(Exception):
     """exception for wake word detection errors."""
     pass
 
 
+def _listen_for_wake_word(
+        audio: pyaudio.PyAudio,
+        ear_decoder: Any,
+        wake_word: str,
+        active_event: Event,
+        shutdown_event: Event,
+        call_from_thread: Callable,
+        update_status: Callable[[str, str], None],
+        auto_stop_listening: Callable[[], None]
+) -> bool:
+    """run one wake word session on an open decoder.
+
+    args:
+        audio: pyaudio instance to open the mic with
+        ear_decoder: initialized pocketsphinx decoder
+        wake_word: wake word to listen for
+        active_event: set while detection should run
+        shutdown_event: set when the app is quitting
+        call_from_thread: function for ui thread calls
+        update_status: function to update ui status
+        auto_stop_listening: function to stop listening
+
+    returns:
+        true if wake word was heard, false if stopped or failed
+    """
+    mic_stream = None
+    utterance_active = False
+    wake_word_heard = False
+
+    # portaudio's callback thread fills the ring, this thread decodes it
+    sound_ring = deque(maxlen=RING_FRAMES)
+    sound_ready = Event()
+
+    def on_audio(in_data, frame_count, time_info, status):
+        sound_ring.append(in_data)
+        sound_ready.set()
+        return None, pyaudio.paContinue
+
+    try:
+        # read the mic directly so the decoder sees audio as it arrives
+        mic_stream = audio.open(
+            format=pyaudio.paInt16,
+            channels=1,
+            rate=SAMPLE_RATE,
+            input=True,
+            frames_per_buffer=FRAME_SIZE,
+            stream_callback=on_audio
+        )
+
+        try:
+            ear_decoder.start_utt()
+            utterance_active = True
+            logger.debug("decoder started")
+        except Exception as e:
+            logger.error(f"error starting decoder: {e}")
+            call_from_thread(update_status, f"decoder start error: {str(e)}", "error")
+            call_from_thread(auto_stop_listening)
+            return False
+
+        while active_event.is_set() and not shutdown_event.is_set() and not wake_word_heard:
+            # wake up on new audio, or periodically to check the events
+            if not sound_ready.wait(timeout=0.1):
+                continue
+            sound_ready.clear()
+
+            while sound_ring and not wake_word_heard:
+                try:
+                    sound_bytes = sound_ring.popleft()
+
+                    try:
+                        ear_decoder.process_raw(sound_bytes, False, False)
+                    except Exception as e:
+                        logger.error(f"audio processing error: {e}")
+                        continue
+
+                    hypothesis = ear_decoder.hyp()
+                    if hypothesis and wake_word.lower() in hypothesis.hypstr.lower():
+                        logger.info(f"wake word '{wake_word}' detected!")
+                        call_from_thread(update_status, "wake word detected! listening...",
+                                         "listening")
+                        wake_word_heard = True
+
+                except Exception as e:
+                    logger.error(f"wake word detection error: {e}")
+                    # continue loop, don't break on random errors
+
+    except Exception as e:
+        logger.error(f"microphone error: {e}")
+        call_from_thread(update_status, f"mic error: {str(e)}", "error")
+        call_from_thread(auto_stop_listening)
+    finally:
+        if utterance_active:
+            try:
+                ear_decoder.end_utt()
+            except Exception as e:
+                logger.warning(f"utterance cleanup warning: {e}")
+        if mic_stream is not None:
+            mic_stream.close()
+
+    return wake_word_heard
+
+
 def detect_wake_word(
         wake_word: str,
         keywords_path: str,
         stop_event: Event,
-        detecting_wake_word: bool,
+        active_event: Event,
+        shutdown_event: Event,
         call_from_thread: Callable,
         update_status: Callable[[str, str], None],
         handle_wake_word_detected: Callable[[], None],
@@ -25,11 +135,15 @@ def detect_wake_word(
 ) -> None:
     """listen for wake word using pocketsphinx.
 
+    runs for the app's lifetime: the decoder is set up once, and each
+    time active_event is set a new detection session starts.
+
     args:
         wake_word: wake word to listen for
         keywords_path: path to keywords file
         stop_event: signal to stop listening
-        detecting_wake_word: active detection flag
+        active_event: set while detection should run, cleared on detection
+        shutdown_event: set when the app is quitting
         call_from_thread: function for ui thread calls
         update_status: function to update ui status
         handle_wake_word_detected: function for wake word detection
@@ -58,81 +172,37 @@ def detect_wake_word(
             call_from_thread(auto_stop_listening)
             return
 
-        call_from_thread(update_status, f"listening for '{wake_word}'...", "wake-word")
-
-        listener = sr.Recognizer()
-        utterance_active = False
-
+        audio = pyaudio.PyAudio()
         try:
-            with sr.Microphone(sample_rate=16000) as ear:
-                try:
-                    listener.adjust_for_ambient_noise(ear, duration=0.5)
-                    logger.debug("adjusted for background noise")
-                except Exception as e:
-                    logger.warning(f"noise adjustment error: {e}")
-                    # continue anyway, not fatal
-
-                try:
-                    ear_decoder.start_utt()
-                    utterance_active = True
-                    logger.debug("decoder started")
-                except Exception as e:
-                    logger.error(f"error starting decoder: {e}")
-                    call_from_thread(update_status, f"decoder start error: {str(e)}", "error")
-                    call_from_thread(auto_stop_listening)
-                    return
-
-                while not stop_event.is_set() and detecting_wake_word:
-                    try:
-                        voice_sample = listener.listen(ear, timeout=1, phrase_time_limit=3)
-
-                        try:
-                            sound_bytes = voice_sample.get_raw_data()
-                            ear_decoder.process_raw(sound_bytes, False, False)
-                        except Exception as e:
-                            logger.error(f"audio processing error: {e}")
-                            continue
-
-                        if ear_decoder.hyp():
-                            hypothesis = ear_decoder.hyp()
-                            if hypothesis and wake_word.lower() in hypothesis.hypstr.lower():
-                                logger.info(f"wake word '{wake_word}' detected!")
-                                call_from_thread(update_status, "wake word detected! listening...",
-                                                 "listening")
-
-                                if utterance_active:
-                                    try:
-                                        ear_decoder.end_utt()
-                                        utterance_active = False
-                                    except Exception as e:
-                                        logger.warning(f"ending utterance warning: {e}")
-
-                                call_from_thread(handle_wake_word_detected)
-                                break
-
-                    except sr.WaitTimeoutError:
-                        pass
-                    except Exception as e:
-                        logger.error(f"wake word detection error: {e}")
-                        # continue loop, don't break on random errors
-
-                if utterance_active:
-                    try:
-                        ear_decoder.end_utt()
-                        utterance_active = False
-                    except Exception as e:
-                        logger.warning(f"utterance cleanup warning: {e}")
-
-        except Exception as e:
-            logger.error(f"microphone error: {e}")
-            call_from_thread(update_status, f"mic error: {str(e)}", "error")
-            call_from_thread(auto_stop_listening)
-
-        if stop_event.is_set():
-            logger.info("wake word detection stopped")
-            call_from_thread(update_status, "stopped", "idle")
+            while not shutdown_event.is_set():
+                # idle until the app asks for wake word detection
+                if not active_event.wait(timeout=0.5):
+                    continue
+
+                call_from_thread(update_status, f"listening for '{wake_word}'...", "wake-word")
+
+                heard = _listen_for_wake_word(
+                    audio,
+                    ear_decoder,
+                    wake_word,
+                    active_event,
+                    shutdown_event,
+                    call_from_thread,
+                    update_status,
+                    auto_stop_listening
+                )
+
+                if heard:
+                    # mic is released, speech recognition can open it now
+                    active_event.clear()
+                    call_from_thread(handle_wake_word_detected)
+                elif stop_event.is_set() and not shutdown_event.is_set():
+                    logger.info("wake word detection stopped")
+                    call_from_thread(update_status, "stopped", "idle")
+        finally:
+            audio.terminate()
 
     except Exception as e:
         logger.critical(f"critical wake word error: {e}")
         call_from_thread(update_status, f"wake word error: {str(e)}", "error")
-        call_from_thread(auto_stop_listening)
\ No newline at end of file
+        call_from_thread(auto_stop_listening)
@@ -1,185 +1,174 @@
-import json
-import os
+import logging
+import re
+import time
+from collections import OrderedDict
 from datetime import datetime
 
 import python_weather
 
-# default location if none specified
-DEFAULT_LOCATION = "Santa Cruz"
-# file to store user's location
-LOCATION_CONFIG_FILE = "location_config.json"
+from utils.helpers import get_saved_location
 
+# set up logging
+logger = logging.getLogger(__name__)
 
-async def get_weather_data(location=None):
-    """get weather data for location.
+# recent reports by location, weather only changes on a scale of minutes
+WEATHER_TTL = 300
+WEATHER_CACHE_SIZE = 32
+_weather_cache = OrderedDict()
 
-    args:
-        location: location to check (uses saved or default if none)
+# weather keywords, matched as whole words with their common inflections
+_SKY_WORDS = (
+    r'weather', r'temperatures?', r'forecasts?', r'rain(?:s|ing|y)?', r'sunny',
+    r'cloudy', r'snow(?:s|ing|y)?', r'storm(?:s|ing|y)?', r'cold', r'hot',
+    r'humid(?:ity)?', r'winds?', r'windy', r'precipitation', r'climate', r'foggy',
+    r'frost(?:y)?', r'hail(?:ing)?', r'thunder(?:storms?)?', r'lightning',
+    r'degrees', r'sunrise', r'sunset'
+)
+_SKY_WORDS_RE = re.compile(r"\b(?:" + "|".join(_SKY_WORDS) + r")\b", re.IGNORECASE)
+_LOCATION_SET_RE = re.compile(r"(?:set|change) my location", re.IGNORECASE)
 
-    returns:
-        dict with weather data or none if failed
-    """
-    try:
-        # use saved location if none given
-        if location is None:
-            location = get_saved_location()
+# phrases that precede a location
+_LOCATION_PHRASE_RE = re.compile(
+    r"(?:set my location to|change my location to|my location is|weather in"
+    r"|temperature in|forecast for|weather for) ([^.?!]*)",
+    re.IGNORECASE
+)
 
-        # get weather
-        async with python_weather.Client(unit=python_weather.IMPERIAL) as sky_eye:
-            # fetch data
-            sky_report = await sky_eye.get(location)
-
-            # current conditions
-            current = {
-                "location": sky_report.location,
-                "region": sky_report.region,
-                "country": sky_report.country,
-                "temperature": sky_report.temperature,
-                "feels_like": sky_report.feels_like,
-                "humidity": sky_report.humidity,
-                "description": sky_report.description,
-                "kind": sky_report.kind.name,
-                "wind_speed": sky_report.wind_speed,
-                "wind_direction": sky_report.wind_direction.name,
-                "precipitation": sky_report.precipitation,
-                "local_time": sky_report.datetime.strftime("%Y-%m-%d %H:%M:%S"),
-                "current_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            }
-
-            # today's forecast
-            if sky_report.daily_forecasts:
-                today = sky_report.daily_forecasts[0]
-                current.update({
-                    "today_high": today.highest_temperature,
-                    "today_low": today.lowest_temperature,
-                    "sunrise": today.sunrise.strftime("%H:%M") if today.sunrise else "N/A",
-                    "sunset": today.sunset.strftime("%H:%M") if today.sunset else "N/A",
-                })
-
-                # upcoming hours
-                coming_hours = []
-                for hour in today.hourly_forecasts:
-                    if hour.time > datetime.now().time():
-                        coming_hours.append({
-                            "time": hour.time.strftime("%H:%M"),
-                            "temperature": hour.temperature,
-                            "description": hour.description,
-                            "chance_of_rain": hour.chances_of_rain,
-                        })
-                        # just get next few hours
-                        if len(coming_hours) >= 3:
-                            break
-
-                if coming_hours:
-                    current["upcoming_hours"] = coming_hours
-
-            return current
-    except Exception as e:
-        print(f"error getting weather: {e}")
-        return None
+# one client (and http session) for the app's lifetime
+_weather_client = None
 
 
-def get_saved_location():
-    """get user's saved location.
+def _get_client():
+    """get the shared weather client, creating it on first use.
 
     returns:
-        saved location or default
+        python_weather client
     """
-    try:
-        if os.path.exists(LOCATION_CONFIG_FILE):
-            with open(LOCATION_CONFIG_FILE, 'r') as f:
-                config = json.load(f)
-                return config.get('location', DEFAULT_LOCATION)
-    except Exception as e:
-        print(f"error reading location config: {e}")
+    global _weather_client
 
-    return DEFAULT_LOCATION
+    # no await between check and create, so this is safe on one event loop
+    if _weather_client is None:
+        _weather_client = python_weather.Client(unit=python_weather.IMPERIAL)
 
+    return _weather_client
 
-def save_location(location):
-    """save user's location.
 
-    args:
-        location: location to save
+async def close_weather_client():
+    """close the shared weather client if it was opened."""
+    global _weather_client
 
-    returns:
-        true if successful, false otherwise
-    """
-    try:
-        config = {'location': location}
-        with open(LOCATION_CONFIG_FILE, 'w') as f:
-            json.dump(config, f)
-        return True
-    except Exception as e:
-        print(f"error saving location: {e}")
-        return False
+    if _weather_client is not None:
+        await _weather_client.close()
+        _weather_client = None
 
 
-def is_weather_query(text):
-    """check if query is about weather.
+async def get_weather_data(location=None, refresh=False):
+    """get weather data for location.
 
     args:
-        text: user's query
+        location: location to check (uses saved or default if none)
+        refresh: skip the cached report and fetch a new one
 
     returns:
-        true if weather-related, false otherwise
+        dict with weather data or none if failed
     """
-    sky_words = [
-        'weather', 'temperature', 'forecast', 'rain', 'sunny', 'cloudy',
-        'snow', 'storm', 'cold', 'hot', 'humid', 'wind', 'windy',
-        'precipitation', 'climate', 'foggy', 'frost', 'hail', 'thunder',
-        'lightning', 'temperature', 'degrees', 'sunrise', 'sunset'
-    ]
-
-    # check for location setting request
-    if "set my location" in text.lower() or "change my location" in text.lower():
-        return True
-
-    # check if any weather words are in the text
-    text_lower = text.lower()
-    for word in sky_words:
-        if word in text_lower:
-            return True
+    try:
+        # use saved location if none given
+        if location is None:
+            location = get_saved_location()
 
-    return False
+        # serve a recent report from memory
+        cache_key = location.lower()
+        cached = _weather_cache.get(cache_key)
+        if cached and not refresh and time.monotonic() - cached[0] < WEATHER_TTL:
+            _weather_cache.move_to_end(cache_key)
+            # only our clock moved, keep it fresh for the prompt
+            return {**cached[1], "current_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+
+        # get weather over the shared client connection
+        sky_eye = _get_client()
+
+        # fetch data
+        sky_report = await sky_eye.get(location)
+
+        # one clock read for the whole report
+        now = datetime.now()
+
+        # current conditions
+        current = {
+            "location": sky_report.location,
+            "region": sky_report.region,
+            "country": sky_report.country,
+            "temperature": sky_report.temperature,
+            "feels_like": sky_report.feels_like,
+            "humidity": sky_report.humidity,
+            "description": sky_report.description,
+            "kind": sky_report.kind.name,
+            "wind_speed": sky_report.wind_speed,
+            "wind_direction": sky_report.wind_direction.name,
+            "precipitation": sky_report.precipitation,
+            "local_time": sky_report.datetime.strftime("%Y-%m-%d %H:%M:%S"),
+            "current_time": now.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+
+        # today's forecast
+        if sky_report.daily_forecasts:
+            today = sky_report.daily_forecasts[0]
+            current.update({
+                "today_high": today.highest_temperature,
+                "today_low": today.lowest_temperature,
+                "sunrise": today.sunrise.strftime("%H:%M") if today.sunrise else "N/A",
+                "sunset": today.sunset.strftime("%H:%M") if today.sunset else "N/A",
+            })
+
+            # upcoming hours
+            coming_hours = []
+            now_time = now.time()
+            for hour in today.hourly_forecasts:
+                if hour.time > now_time:
+                    coming_hours.append({
+                        "time": hour.time.strftime("%H:%M"),
+                        "temperature": hour.temperature,
+                        "description": hour.description,
+                        "chance_of_rain": hour.chances_of_rain,
+                    })
+                    # just get next few hours
+                    if len(coming_hours) >= 3:
+                        break
+
+            if coming_hours:
+                current["upcoming_hours"] = coming_hours
+
+        # remember report, dropping the least recently used location
+        _weather_cache[cache_key] = (time.monotonic(), current)
+        _weather_cache.move_to_end(cache_key)
+        if len(_weather_cache) > WEATHER_CACHE_SIZE:
+            _weather_cache.popitem(last=False)
+
+        return current
+    except Exception as e:
+        logger.error(f"error getting weather: {e}")
+        return None
 
 
-def extract_location(text):
-    """extract location from text.
+def classify_weather(text):
+    """check if query is about weather and extract its location in one pass.
 
     args:
-        text: text to extract from
+        text: user's query
 
     returns:
-        location or none if not found
+        tuple of (is_weather_query, location)
     """
-    text_lower = text.lower()
-
-    # check for location patterns
-    location_phrases = [
-        "set my location to ",
-        "change my location to ",
-        "my location is ",
-        "weather in ",
-        "temperature in ",
-        "forecast for ",
-        "weather for ",
-        "how's the weather in ",
-        "how is the weather in ",
-        "weather"
-    ]
-
-    for phrase in location_phrases:
-        if phrase in text_lower:
-            # get location after phrase
-            place = text_lower.split(phrase, 1)[1].strip()
-            # remove sentence endings
-            for ending in ['.', '?', '!']:
-                if ending in place:
-                    place = place.split(ending, 1)[0].strip()
-            return place if place else None
-
-    return None
+    # patterns ignore case, so the text is never lowercased and keeps its casing
+    if not (_LOCATION_SET_RE.search(text) or _SKY_WORDS_RE.search(text)):
+        return False, None
+
+    # only trust an explicit phrase; a bare "weather ..." tail is usually not a place
+    match = _LOCATION_PHRASE_RE.search(text)
+    place = match.group(1).strip() if match else ""
+
+    return True, place if place else None
 
 
 def format_weather_data_for_prompt(weather_data):
@@ -195,7 +184,7 @@ def format_weather_data_for_prompt(weather_data):
         return "weather data couldn't be retrieved."
 
     # format current weather
-    sky_text = f"""
+    sky_parts = [f"""
         --- CURRENT WEATHER DATA ---
         Location: {weather_data['location']}, {weather_data['region']}, {weather_data['country']}
         Current Time: {weather_data['local_time']}
@@ -203,21 +192,21 @@ def format_weather_data_for_prompt(weather_data):
         Conditions: {weather_data['description']}
         Humidity: {weather_data['humidity']}%
         Wind: {weather_data['wind_speed']} km/h {weather_data['wind_direction']}
-"""
+"""]
 
     # add high/low
     if 'today_high' in weather_data and 'today_low' in weather_data:
-        sky_text += f"Today's High: {weather_data['today_high']}°F / Low: {weather_data['today_low']}°F\n"
+        sky_parts.append(f"Today's High: {weather_data['today_high']}°F / Low: {weather_data['today_low']}°F\n")
 
     # add sunrise/sunset
     if 'sunrise' in weather_data and 'sunset' in weather_data:
-        sky_text += f"Sunrise: {weather_data['sunrise']} / Sunset: {weather_data['sunset']}\n"
+        sky_parts.append(f"Sunrise: {weather_data['sunrise']} / Sunset: {weather_data['sunset']}\n")
 
     # add upcoming hours
     if 'upcoming_hours' in weather_data and weather_data['upcoming_hours']:
-        sky_text += "\nUpcoming Hours:\n"
+        sky_parts.append("\nUpcoming Hours:\n")
         for hour in weather_data['upcoming_hours']:
             rain_chance = f" ({hour['chance_of_rain']}% chance of rain)" if hour['chance_of_rain'] > 0 else ""
-            sky_text += f"- {hour['time']}: {hour['temperature']}°F, {hour['description']}{rain_chance}\n"
+            sky_parts.append(f"- {hour['time']}: {hour['temperature']}°F, {hour['description']}{rain_chance}\n")
 
-    return sky_text
\ No newline at end of file
+    return "".join(sky_parts)
@@ -2,6 +2,7 @@ import asyncio
 import logging
 import os
 import tempfile
+import time
 from threading import Thread, Event
 
 import speech_recognition as sr
@@ -12,14 +13,19 @@ from textual.widgets import Footer, Header, Static
 
 from services.intents import SimilarityIntentDetector
 from services.model import get_ollama_response
-from services.stt import listen_to_microphone
+from services.stt import listen_to_microphone, load_whisper_model
 from services.time import get_time_data, format_time_data_for_prompt
 from services.wake_word import detect_wake_word
-from services.weather import get_weather_data, format_weather_data_for_prompt
+from services.weather import (
+    WEATHER_TTL, get_weather_data, format_weather_data_for_prompt, close_weather_client
+)
 from ui.widgets import ListeningIndicator, ResponseArea
 
 logger = logging.getLogger(__name__)
 
+# seconds between repaints while a response streams in
+RENDER_INTERVAL = 0.05
+
 class StatusPanel(Static):
     """panel showing current status."""
 
@@ -66,9 +72,24 @@ class VoiceAssistantApp(App):
         self.direct_listening_mode = False
         self.stop_event = Event()
         self.wake_word_detected_event = Event()
+        # wake word thread lives for the whole session, toggled by these
+        self.wake_word_active = Event()
+        self.shutdown_event = Event()
 
         self.temp_dir = None
+        self.words_file = None
+
+        # models and audio devices load in the background once mounted
+        self.brain = None
+        self.use_spacy_intent = False
+        self.brain_loader = None
+        self.audio_loader = None
+
+        self.ear = sr.Recognizer()
+        self.mic_list = []
 
+    def load_intent_detector(self) -> None:
+        """load spacy intent detector (runs in background thread)."""
         try:
             self.brain = SimilarityIntentDetector(model="en_core_web_md")
             logger.info("initialized spacy intent detector")
@@ -79,12 +100,14 @@ class VoiceAssistantApp(App):
             self.use_spacy_intent = False
             logger.info("falling back to keyword detection")
 
+    def load_audio(self) -> None:
+        """list microphones and warm up speech model (runs in background thread)."""
         try:
-            self.ear = sr.Recognizer()
             self.mic_list = sr.Microphone.list_microphone_names()
         except Exception as e:
-            print(f"audio init warning: {e}")
-            self.ear = sr.Recognizer()
+            logger.warning(f"audio init warning: {e}")
+
+        load_whisper_model()
 
     def compose(self) -> ComposeResult:
         """create child widgets."""
@@ -107,6 +130,25 @@ class VoiceAssistantApp(App):
             f"[dim]• press [bold]ctrl+q[/bold] to quit[/dim]"
         )
 
+        # slow init runs on daemon threads so the ui paints right away
+        # and quitting never waits on a model still loading
+        self.brain_loader = Thread(target=self.load_intent_detector)
+        self.brain_loader.daemon = True
+        self.brain_loader.start()
+
+        self.audio_loader = Thread(target=self.load_audio)
+        self.audio_loader.daemon = True
+        self.audio_loader.start()
+
+        # have the home location's weather cached before it's asked for
+        self.refresh_weather()
+        self.set_interval(WEATHER_TTL, self.refresh_weather)
+
+    @work(exclusive=True, group="weather")
+    async def refresh_weather(self) -> None:
+        """fetch weather for the saved location into the cache (no ui updates)."""
+        await get_weather_data(refresh=True)
+
     def action_toggle_wake_word(self) -> None:
         """toggle wake word detection."""
         if not self.detecting_wake_word:
@@ -125,12 +167,14 @@ class VoiceAssistantApp(App):
         """stop all listening processes."""
         self.stop_all()
 
-    def action_quit(self) -> None:
+    async def action_quit(self) -> None:
         """quit the app."""
         self.should_listen = False
         self.detecting_wake_word = False
         self.direct_listening_mode = False
         self.stop_event.set()
+        self.wake_word_active.clear()
+        self.shutdown_event.set()
         if self.listening_thread and self.listening_thread.is_alive():
             self.listening_thread.join(timeout=1)
         if self.wake_word_thread and self.wake_word_thread.is_alive():
@@ -142,8 +186,49 @@ class VoiceAssistantApp(App):
                 shutil.rmtree(self.temp_dir)
             except:
                 pass
+
+        await close_weather_client()
         self.exit()
 
+    def ensure_keywords_file(self) -> str:
+        """write pocketsphinx keywords file on first use.
+
+        returns:
+            path to keywords file
+        """
+        # wake word is fixed for the app's lifetime, so one write is enough
+        if self.words_file is None:
+            if not self.temp_dir:
+                self.temp_dir = tempfile.mkdtemp()
+
+            self.words_file = os.path.join(self.temp_dir, "keywords.list")
+            with open(self.words_file, "w") as f:
+                f.write(f"{self.wake_word} /1e-20/\n")
+
+        return self.words_file
+
+    def ensure_wake_word_thread(self) -> None:
+        """start the long-lived wake word thread if it isn't running."""
+        if self.wake_word_thread and self.wake_word_thread.is_alive():
+            return
+
+        self.wake_word_thread = Thread(
+            target=detect_wake_word,
+            args=(
+                self.wake_word,
+                self.ensure_keywords_file(),
+                self.stop_event,
+                self.wake_word_active,
+                self.shutdown_event,
+                self.call_from_thread,
+                self.update_status,
+                self.handle_wake_word_detected,
+                self.auto_stop_listening
+            )
+        )
+        self.wake_word_thread.daemon = True
+        self.wake_word_thread.start()
+
     def start_wake_word_detection(self) -> None:
         """start wake word detection."""
         if not self.detecting_wake_word:
@@ -152,53 +237,40 @@ class VoiceAssistantApp(App):
             self.stop_event.clear()
             self.wake_word_detected_event.clear()
 
-            if not self.temp_dir:
-                self.temp_dir = tempfile.mkdtemp()
+            self.ensure_wake_word_thread()
+            self.wake_word_active.set()
 
-            words_file = os.path.join(self.temp_dir, "keywords.list")
-            with open(words_file, "w") as f:
-                f.write(f"{self.wake_word} /1e-20/\n")
+            self.update_status(f"waiting for wake word '{self.wake_word}'...", "wake-word")
 
-            self.wake_word_thread = Thread(
-                target=detect_wake_word,
-                args=(
-                    self.wake_word,
-                    words_file,
-                    self.stop_event,
-                    self.detecting_wake_word,
-                    self.call_from_thread,
-                    self.update_status,
-                    self.handle_wake_word_detected,
-                    self.auto_stop_listening
-                )
+    def start_listening_thread(self) -> None:
+        """run one speech recognition pass in a background thread."""
+        # daemon thread so quitting never waits on a listen or transcription
+        self.listening_thread = Thread(
+            target=listen_to_microphone,
+            args=(
+                self.ear,
+                self.should_listen,
+                self.stop_event,
+                self.call_from_thread,
+                self.update_status,
+                self.get_ai_response,
+                self.restart_wake_word_detection
             )
-            self.wake_word_thread.daemon = True
-            self.wake_word_thread.start()
-
-            self.update_status(f"waiting for wake word '{self.wake_word}'...", "wake-word")
+        )
+        self.listening_thread.daemon = True
+        self.listening_thread.start()
 
     def start_direct_listening(self) -> None:
         """start listening without wake word."""
         if not self.should_listen:
             self.stop_event.clear()
             self.detecting_wake_word = False
+            # end any wake word session so it releases the mic first
+            self.wake_word_active.clear()
             self.direct_listening_mode = True
 
             self.should_listen = True
-            self.listening_thread = Thread(
-                target=listen_to_microphone,
-                args=(
-                    self.ear,
-                    self.should_listen,
-                    self.stop_event,
-                    self.call_from_thread,
-                    self.update_status,
-                    self.get_ai_response,
-                    self.restart_wake_word_detection
-                )
-            )
-            self.listening_thread.daemon = True
-            self.listening_thread.start()
+            self.start_listening_thread()
 
             self.update_status("listening for your voice...", "listening")
 
@@ -208,32 +280,14 @@ class VoiceAssistantApp(App):
         self.detecting_wake_word = False
         self.direct_listening_mode = False
         self.stop_event.set()
-        status_light = self.query_one(ListeningIndicator)
-        status_light.status = "idle"
-        status_light.remove_class("listening")
-        status_light.remove_class("processing")
-        status_light.remove_class("error")
-        status_light.remove_class("wake-word")
-        status_light.add_class("idle")
+        self.wake_word_active.clear()
+        self.update_status("idle", "idle")
 
     def handle_wake_word_detected(self) -> None:
         """handle wake word by starting speech recognition."""
         if not self.should_listen:
             self.should_listen = True
-            self.listening_thread = Thread(
-                target=listen_to_microphone,
-                args=(
-                    self.ear,
-                    self.should_listen,
-                    self.stop_event,
-                    self.call_from_thread,
-                    self.update_status,
-                    self.get_ai_response,
-                    self.restart_wake_word_detection
-                )
-            )
-            self.listening_thread.daemon = True
-            self.listening_thread.start()
+            self.start_listening_thread()
 
     def restart_wake_word_detection(self) -> None:
         """restart wake word detection after command."""
@@ -241,52 +295,21 @@ class VoiceAssistantApp(App):
 
         if self.direct_listening_mode:
             self.direct_listening_mode = False
-            status_light = self.query_one(ListeningIndicator)
-            status_light.status = "idle"
-            status_light.remove_class("listening")
-            status_light.remove_class("processing")
-            status_light.remove_class("error")
-            status_light.remove_class("wake-word")
-            status_light.add_class("idle")
+            self.update_status("idle", "idle")
 
         elif self.detecting_wake_word and not self.stop_event.is_set():
-            if not self.temp_dir:
-                self.temp_dir = tempfile.mkdtemp()
-
-            words_file = os.path.join(self.temp_dir, "keywords.list")
-            with open(words_file, "w") as f:
-                f.write(f"{self.wake_word} /1e-20/\n")
-
-            self.wake_word_thread = Thread(
-                target=detect_wake_word,
-                args=(
-                    self.wake_word,
-                    words_file,
-                    self.stop_event,
-                    self.detecting_wake_word,
-                    self.call_from_thread,
-                    self.update_status,
-                    self.handle_wake_word_detected,
-                    self.auto_stop_listening
-                )
-            )
-            self.wake_word_thread.daemon = True
-            self.wake_word_thread.start()
+            self.ensure_wake_word_thread()
+            self.wake_word_active.set()
 
         else:
-            status_light = self.query_one(ListeningIndicator)
-            status_light.status = "idle"
-            status_light.remove_class("listening")
-            status_light.remove_class("processing")
-            status_light.remove_class("error")
-            status_light.remove_class("wake-word")
-            status_light.add_class("idle")
+            self.update_status("idle", "idle")
 
     def auto_stop_listening(self) -> None:
         """auto stop and return to wake word detection."""
         self.should_listen = False
         self.detecting_wake_word = False
         self.direct_listening_mode = False
+        self.wake_word_active.clear()
 
     def update_status(self, status: str, class_name: str) -> None:
         """update status indicator.
@@ -298,13 +321,35 @@ class VoiceAssistantApp(App):
         status_light = self.query_one(ListeningIndicator)
         status_light.status = status
 
-        status_light.remove_class("listening")
-        status_light.remove_class("processing")
-        status_light.remove_class("error")
-        status_light.remove_class("idle")
-        status_light.remove_class("wake-word")
+        # status class is the indicator's only class, swap it in one update
+        status_light.set_classes(class_name)
+
+    def read_stream(self, brain_stream, chunk_queue: asyncio.Queue, loop: asyncio.AbstractEventLoop) -> None:
+        """hand model chunks to the event loop (runs in background thread).
 
-        status_light.add_class(class_name)
+        args:
+            brain_stream: iterator from get_ollama_response
+            chunk_queue: queue read by get_ai_response, ends with none or an exception
+            loop: event loop that owns the queue
+        """
+        def hand_off(item) -> None:
+            loop.call_soon_threadsafe(chunk_queue.put_nowait, item)
+
+        try:
+            try:
+                for thought in brain_stream:
+                    hand_off(thought)
+                    if self.stop_event.is_set():
+                        break
+            except Exception as e:
+                hand_off(e)
+            finally:
+                # releases the connection if we stopped early
+                brain_stream.close()
+            hand_off(None)
+        except RuntimeError:
+            # loop already closed, app is quitting
+            pass
 
     @work
     async def get_ai_response(self, text: str) -> None:
@@ -321,12 +366,19 @@ class VoiceAssistantApp(App):
         await answer_box.type_response(text, is_user=True)
         await asyncio.sleep(0.1)
 
+        # first query may arrive before the intent model is ready
+        if self.brain_loader and self.brain_loader.is_alive():
+            self.update_status("loading intent model...", "processing")
+            # poll rather than join on an executor thread, which would hold up quitting
+            while self.brain_loader.is_alive():
+                await asyncio.sleep(0.05)
+
         self.update_status("getting ai response...", "processing")
 
         # detect intent using spacy
         intent_result = None
         if self.use_spacy_intent and self.brain:
-            intent_result = self.brain.detect_intent(text)
+            intent_result = self.brain.classify(text)
             logger.info(f"detected intent: {intent_result['intent']} (confidence: {intent_result['confidence']:.2f})")
 
         # handle different intents
@@ -367,24 +419,36 @@ class VoiceAssistantApp(App):
             # use augmented text
             brain_stream = get_ollama_response(brain_food, model=self.model, system_prompt=self.system_prompt)
 
-            answer_box.text += "\n\n[bold cyan]brother_eye:[/] "
-            answer_box.update(answer_box.text)
+            answer_box.start_stream()
             await asyncio.sleep(0.05)
 
-            full_response = ""
-            buffer_size = 1024
-            for thought in brain_stream:
-                if self.stop_event.is_set():
+            # read on a daemon thread so the ui keeps drawing between chunks
+            # and quitting never waits on a blocked socket read
+            chunk_queue = asyncio.Queue()
+            stream_reader = Thread(
+                target=self.read_stream,
+                args=(brain_stream, chunk_queue, asyncio.get_running_loop())
+            )
+            stream_reader.daemon = True
+            stream_reader.start()
+
+            last_render = time.monotonic()
+            while True:
+                thought = await chunk_queue.get()
+                if isinstance(thought, Exception):
+                    raise thought
+                if thought is None or self.stop_event.is_set():
                     break
 
-                full_response += thought
-                if len(full_response) > buffer_size:
-                    full_response = full_response[-buffer_size:]
+                answer_box.append_stream(thought)
+
+                # repaint on an interval instead of on every token
+                now = time.monotonic()
+                if now - last_render >= RENDER_INTERVAL:
+                    answer_box.flush_stream()
+                    last_render = now
 
-                answer_box.text = answer_box.text.rsplit("[bold cyan]brother_eye:[/] ", 1)[0] + \
-                                  "[bold cyan]brother_eye:[/] " + full_response
-                answer_box.update(answer_box.text)
-                await asyncio.sleep(0.01)
+            answer_box.flush_stream()
 
             self.restart_wake_word_detection()
         except Exception as e:
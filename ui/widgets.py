@@ -1,8 +1,16 @@
 import asyncio
+import re
 from textual.reactive import reactive
 from textual.widgets import Static
 from textual.binding import Binding
 
+# typing effect: characters per repaint and pause between repaints
+TYPING_CHUNK = 16
+TYPING_DELAY = 0.03
+
+# escapes rich markup brackets in one pass
+_MARKUP_ESCAPE = str.maketrans({"[": r"\[", "]": r"\]"})
+
 
 class ListeningIndicator(Static):
     """widget to show voice assistant status."""
@@ -27,7 +35,7 @@ class ListeningIndicator(Static):
         face = mood_icons.get(base_mood, "🔄")
 
         # escape rich markup
-        clean_status = self.status.replace("[", r"\[").replace("]", r"\]")
+        clean_status = self.status.translate(_MARKUP_ESCAPE)
 
         return f"{face} {clean_status}"
 
@@ -39,10 +47,27 @@ class ResponseArea(Static):
         Binding("ctrl+c", "copy_text", "copy", show=False)
     ]
 
+    # speaker tags, built once
+    USER_TAG = "[bold red]user:[/] "
+    AI_TAG = "[bold cyan]brother_eye:[/] "
+
+    # plain text names for the tags when copying
+    PLAIN_TAGS = {USER_TAG: "you: ", AI_TAG: "assistant: "}
+    _PLAIN_RE = re.compile("|".join(re.escape(tag) for tag in PLAIN_TAGS))
+
+    # characters of a streamed reply kept on screen
+    STREAM_TAIL = 1024
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.text = ""
         self.is_typing = False
+        # where the ai reply (and its separator) starts in self.text
+        self._ai_start_index = None
+        # streamed reply pieces, joined only when repainting
+        self._stream_prefix = ""
+        self._segments = []
+        self._segments_len = 0
 
     def on_mount(self):
         self.styles.padding = (1, 2)
@@ -60,32 +85,25 @@ class ResponseArea(Static):
 
         try:
             if is_user:
-                # user text with typing animation
-                person_tag = "[bold red]user:[/] "
-                self.text = person_tag
+                # user already said it, show it in one go
+                self.text = self.USER_TAG + text
+                self._ai_start_index = None
+                self._stream_prefix = ""
                 self.update(self.text)
-                await asyncio.sleep(0.05)
-
-                for letter in text:
-                    if not self.is_typing:  # check if interrupted
-                        break
-                    self.text += letter
-                    self.update(self.text)
-                    await asyncio.sleep(0.01)
 
                 await asyncio.sleep(0.1)
             else:
                 # ai responses
-                self.text += "\n\n[bold cyan]brother_eye:[/] "
-                self.update(self.text)
+                self.start_ai_response()
                 await asyncio.sleep(0.05)
 
-                for letter in text:
+                # type a chunk at a time rather than a letter at a time
+                for start in range(0, len(text), TYPING_CHUNK):
                     if not self.is_typing:  # check if interrupted
                         break
-                    self.text += letter
+                    self.text += text[start:start + TYPING_CHUNK]
                     self.update(self.text)
-                    await asyncio.sleep(0.01)
+                    await asyncio.sleep(TYPING_DELAY)
         finally:
             self.is_typing = False
 
@@ -96,20 +114,53 @@ class ResponseArea(Static):
             text: transcribed text
             is_partial: if partial transcription
         """
-        # first update, add user prefix
-        if not self.text or not self.text.startswith("[bold red]user:[/] "):
-            self.text = "[bold red]user:[/] " + text
+        if self._ai_start_index is not None and self.text.startswith(self.USER_TAG):
+            # swap the user part, keep ai response intact
+            user_part = self.USER_TAG + text
+            self.text = user_part + self.text[self._ai_start_index:]
+            if self._stream_prefix:
+                # a reply still streaming repaints from its prefix, splice that too
+                self._stream_prefix = user_part + self._stream_prefix[self._ai_start_index:]
+            self._ai_start_index = len(user_part)
         else:
-            # update just user part
-            parts = self.text.split("[bold cyan]brother_eye:[/]", 1)
-            if len(parts) > 1:
-                # keep ai response intact
-                person_part = "[bold red]user:[/] " + text
-                self.text = person_part + "[bold cyan]brother_eye:[/]" + parts[1]
-            else:
-                # only user text exists
-                self.text = "[bold red]user:[/] " + text
+            # only user text exists (or none yet)
+            self.text = self.USER_TAG + text
+            self._ai_start_index = None
+
+        self.update(self.text)
+
+    def start_ai_response(self) -> None:
+        """add the ai tag after the current text and remember where the first one starts."""
+        if self._ai_start_index is None:
+            self._ai_start_index = len(self.text)
+        self.text += "\n\n" + self.AI_TAG
+        self.update(self.text)
+
+    def start_stream(self) -> None:
+        """start a streamed ai reply after the current text."""
+        self.start_ai_response()
+        self._stream_prefix = self.text
+        self._segments = []
+        self._segments_len = 0
+
+    def append_stream(self, chunk: str) -> None:
+        """add a streamed chunk without repainting.
 
+        args:
+            chunk: text chunk from the model
+        """
+        self._segments.append(chunk)
+        self._segments_len += len(chunk)
+
+        # compact once the pieces grow well past what is shown
+        if self._segments_len > 2 * self.STREAM_TAIL:
+            tail = "".join(self._segments)[-self.STREAM_TAIL:]
+            self._segments = [tail]
+            self._segments_len = len(tail)
+
+    def flush_stream(self) -> None:
+        """repaint with the streamed reply so far."""
+        self.text = self._stream_prefix + "".join(self._segments)[-self.STREAM_TAIL:]
         self.update(self.text)
 
     def stop_typing(self):
@@ -119,6 +170,8 @@ class ResponseArea(Static):
     def clear(self):
         """clear all text."""
         self.text = ""
+        self._ai_start_index = None
+        self._stream_prefix = ""
         self.update("")
         self.is_typing = False
 
@@ -126,8 +179,7 @@ class ResponseArea(Static):
         """copy content to clipboard."""
         if self.text:
             # strip rich markup for plain text
-            plain_words = self.text.replace("[bold red]user:[/] ", "you: ")
-            plain_words = plain_words.replace("[bold cyan]brother_eye:[/] ", "assistant: ")
+            plain_words = self._PLAIN_RE.sub(lambda match: self.PLAIN_TAGS[match.group(0)], self.text)
             self.app.copy_to_clipboard(plain_words)
             # notify user
             self.notify("conversation copied to clipboard", timeout=2)
\ No newline at end of file
@@ -1,11 +1,27 @@
+import contextlib
 import os
+import stat
 import tempfile
 import logging
 from typing import Optional
 
+import orjson
+
 # set up logging
 logger = logging.getLogger(__name__)
 
+# default location if none specified
+DEFAULT_LOCATION = "Santa Cruz"
+# file to store user's location
+LOCATION_CONFIG_FILE = "location_config.json"
+# saved location, loaded from the config file on first use
+_saved_location = None
+
+# mode open() would give a new file (0o666 minus umask); temp files start at 0o600
+_umask = os.umask(0)
+os.umask(_umask)
+CONFIG_FILE_MODE = 0o666 & ~_umask
+
 
 def create_temp_directory() -> str:
     """create temporary directory.
@@ -36,4 +52,63 @@ def cleanup_temp_directory(dir_path: Optional[str]) -> bool:
         except Exception as e:
             logger.error(f"error cleaning temp dir: {e}")
             return False
-    return False
\ No newline at end of file
+    return False
+
+
+def get_saved_location() -> str:
+    """get user's saved location.
+
+    returns:
+        saved location or default
+    """
+    global _saved_location
+
+    # config only changes through save_location, so read it once
+    if _saved_location is not None:
+        return _saved_location
+
+    try:
+        if os.path.exists(LOCATION_CONFIG_FILE):
+            with open(LOCATION_CONFIG_FILE, 'rb') as f:
+                config = orjson.loads(f.read())
+                _saved_location = config.get('location', DEFAULT_LOCATION)
+                return _saved_location
+    except Exception as e:
+        logger.error(f"error reading location config: {e}")
+
+    return DEFAULT_LOCATION
+
+
+def save_location(location: str) -> bool:
+    """save user's location.
+
+    args:
+        location: location to save
+
+    returns:
+        true if successful, false otherwise
+    """
+    global _saved_location
+
+    temp_file = None
+    try:
+        config = {'location': location}
+        # one write into a unique temp file next to the config, then swap it in
+        config_dir = os.path.dirname(os.path.abspath(LOCATION_CONFIG_FILE))
+        with tempfile.NamedTemporaryFile('wb', dir=config_dir, suffix=".tmp", delete=False) as f:
+            temp_file = f.name
+            f.write(orjson.dumps(config))
+        # keep the config's existing permissions instead of the temp file's
+        if os.path.exists(LOCATION_CONFIG_FILE):
+            os.chmod(temp_file, stat.S_IMODE(os.stat(LOCATION_CONFIG_FILE).st_mode))
+        else:
+            os.chmod(temp_file, CONFIG_FILE_MODE)
+        os.replace(temp_file, LOCATION_CONFIG_FILE)
+        _saved_location = location
+        return True
+    except Exception as e:
+        logger.error(f"error saving location: {e}")
+        if temp_file:
+            with contextlib.suppress(OSError):
+                os.remove(temp_file)
+        return False